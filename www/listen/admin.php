@@ -800,27 +800,28 @@ function generateCalFSEQ($startCh, $chCount, $flashFrames) {
 
   // FSEQ v2.0 header (32 bytes)
   $dataOffset = 32;
-  $header  = pack('a4', 'PSEQ');            // magic
-  $header .= pack('v', $dataOffset);        // channel data start (uint16 LE)
-  $header .= pack('C', 0);                  // minor version
-  $header .= pack('C', 2);                  // major version
-  $header .= pack('v', $dataOffset);        // variable header offset
-  $header .= pack('V', $channelsPerFrame);  // channels per frame (uint32 LE)
-  $header .= pack('V', $frameCount);        // frame count (uint32 LE)
-  $header .= pack('C', $stepMs);            // step time ms
-  $header .= pack('C', 0);                  // flags
-  $header .= pack('C', 0);                  // compression (0=none)
-  $header .= pack('C', 0);                  // compression blocks
-  $header .= pack('C', 0);                  // sparse ranges
-  $header .= pack('C', 0);                  // flags2
-  $header .= str_repeat("\x00", 8);          // UUID
-
-  // Build frame templates
+  $header = pack('a4vCCvVVCCCCCCa8',
+    'PSEQ',             // magic
+    $dataOffset,        // channel data start (uint16 LE)
+    0,                  // minor version
+    2,                  // major version
+    $dataOffset,        // variable header offset
+    $channelsPerFrame,  // channels per frame (uint32 LE)
+    $frameCount,        // frame count (uint32 LE)
+    $stepMs,            // step time ms
+    0,                  // flags
+    0,                  // compression (0=none)
+    0,                  // compression blocks
+    0,                  // sparse ranges
+    0,                  // flags2
+    ''                  // UUID (a8 = 8 NUL bytes)
+  );
+
+  // Build frame templates (flash frame = zeros | 0xFF run | zeros, built in one pass)
   $blankFrame = str_repeat("\x00", $channelsPerFrame);
-  $flashFrame = $blankFrame;
-  for ($c = $startCh - 1; $c < $startCh - 1 + $chCount; $c++) {
-    $flashFrame[$c] = "\xFF";
-  }
+  $flashFrame = str_repeat("\x00", $startCh - 1)
+              . str_repeat("\xFF", $chCount)
+              . str_repeat("\x00", $channelsPerFrame - $maxCh);
 
   // Build set of flash frame indices (every 1 second, centered)
   $halfFlash = intval($flashFrames / 2);
@@ -835,22 +836,49 @@ function generateCalFSEQ($startCh, $chCount, $flashFrames) {
     }
   }
 
-  // Generate frame data
-  $data = '';
-  for ($f = 0; $f < $frameCount; $f++) {
-    $data .= isset($flashSet[$f]) ? $flashFrame : $blankFrame;
-  }
-
-  // Write FSEQ file
+  // Write FSEQ file, streaming frames straight to the handle so the full
+  // sequence (up to ~25MB at 33280 channels) is never held in memory
   $seqDir = '/home/fpp/media/sequences';
   $fseqPath = $seqDir . '/_bt_cal.fseq';
-  $fileContent = $header . $data;
+  $tmpFile = null;
 
-  $written = @file_put_contents($fseqPath, $fileContent);
-  if ($written === false) {
+  $fh = @fopen($fseqPath, 'wb');
+  if ($fh === false) {
     // Fall back to temp file + sudo cp
     $tmpFile = tempnam(sys_get_temp_dir(), 'fseq_');
-    file_put_contents($tmpFile, $fileContent);
+    $fh = @fopen($tmpFile, 'wb');
+    if ($fh === false) {
+      @unlink($tmpFile);
+      return ["success" => false, "error" => "Failed to write FSEQ file"];
+    }
+  }
+
+  // Write each run of identical frames with a single fwrite (~30 writes
+  // instead of 750); a run is at most one second of frames. Every write is
+  // checked so a short write (e.g. full SD card) never leaves a truncated
+  // sequence whose header still claims 750 frames.
+  $ok = fwrite($fh, $header) === strlen($header);
+  $runStart = 0;
+  for ($f = 1; $ok && $f <= $frameCount; $f++) {
+    if ($f < $frameCount && isset($flashSet[$f]) === isset($flashSet[$runStart])) continue;
+    $frame = isset($flashSet[$runStart]) ? $flashFrame : $blankFrame;
+    $run = str_repeat($frame, $f - $runStart);
+    $ok = fwrite($fh, $run) === strlen($run);
+    $runStart = $f;
+  }
+  $ok = fclose($fh) && $ok;
+
+  if (!$ok) {
+    // Remove the partial file; never sudo cp a truncated temp file
+    if ($tmpFile !== null) {
+      @unlink($tmpFile);
+    } else {
+      cleanupCalFSEQ();
+    }
+    return ["success" => false, "error" => "Failed to write FSEQ file"];
+  }
+
+  if ($tmpFile !== null) {
     exec("sudo /bin/cp " . escapeshellarg($tmpFile) . " " . escapeshellarg($fseqPath) . " 2>&1", $out, $ret);
     exec("sudo /bin/chown fpp:fpp " . escapeshellarg($fseqPath) . " 2>&1");
     unlink($tmpFile);